@@ -96,6 +96,7 @@ keys_kwargs = [
     "variables",
     "var_def",
     "skip_units",
+    "chunks",
 ]
 
 # QARTOD defs
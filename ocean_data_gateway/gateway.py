@@ -8,18 +8,51 @@ import pint_xarray  # isort:skip
 
 pint_xarray.unit_registry = units  # isort:skip
 
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from functools import cached_property  # noqa: E402
+
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 import pint_xarray  # noqa: E402
 import xarray as xr  # noqa: E402
 
-from ioos_qc.config import QcConfig  # noqa: E402
-
 import ocean_data_gateway as odg  # noqa: E402
 
 from ocean_data_gateway import Reader  # noqa: E402
 from ocean_data_gateway import utils  # noqa: E402
 
 
+def _gross_range(arr, fail_span, suspect_span):
+    """Vectorized QARTOD gross range test.
+
+    Classifies values in one pass with numpy instead of going through
+    `ioos_qc.QcConfig`, which re-parses its config dict and dispatches
+    generically for what amounts to a few comparisons.
+
+    Parameters
+    ----------
+    arr: array_like
+        Values to check. Can be a numpy or dask array; dask arrays are
+        classified lazily without being read into memory.
+    fail_span: list
+        [min, max] outside of which values fail.
+    suspect_span: list
+        [min, max] outside of which values are suspect.
+
+    Returns
+    -------
+    Array of QARTOD flags matching arr in shape: 1 (GOOD), 3 (SUSPECT),
+    4 (FAIL), or 9 (MISSING), as in `odg.qcdefs`.
+    """
+
+    # built from np.where so dask arrays pass through lazily instead of
+    # being computed
+    flags = np.where((arr < suspect_span[0]) | (arr > suspect_span[1]), 3, 1)
+    flags = np.where((arr < fail_span[0]) | (arr > fail_span[1]), 4, flags)
+    flags = np.where(np.isnan(arr), 9, flags)
+    return flags.astype(np.uint8)
+
+
 class Gateway(Reader):
     """
     Wraps together the individual readers in order to have a single way to
@@ -50,6 +83,12 @@ class Gateway(Reader):
             If False, run serially. True by default. If input in this manner,
             the same value is used for all readers. If input by individual
             reader dictionary, the value can vary by reader.
+        chunks: dict, optional
+            How datasets opened with xarray by the readers should be chunked,
+            for example `chunks={"time": -1}`. By default (None) each
+            variable is read in as a single chunk, which avoids building
+            very large dask task graphs for datasets with many small native
+            chunks. Input a dict to opt into dask-backed reads.
         readers: ocean_data_gateway Reader, list of readers, optional
             Use this to use fewer than the full set of readers. For example,
             `readers=odg.erddap` or to specifically include all by name
@@ -99,15 +138,14 @@ class Gateway(Reader):
         """
 
         # make sure only known keys are input in kwargs
-        unknown_keys = set(list(kwargs.keys())) - set(odg.keys_kwargs)
+        kwargs_keys = set(kwargs)
+        unknown_keys = kwargs_keys - set(odg.keys_kwargs)
         assertion = f"keys into Gateway {unknown_keys} are unknown."
         assert len(unknown_keys) == 0, assertion
 
         # set up a dictionary for general input kwargs
-        exclude_keys = ["erddap", "axds", "local"]
-        kwargs_all = {
-            k: kwargs[k] for k in set(list(kwargs.keys())) - set(exclude_keys)
-        }
+        exclude_keys = {"erddap", "axds", "local"}
+        kwargs_all = {k: kwargs[k] for k in kwargs_keys - exclude_keys}
 
         self.kwargs_all = kwargs_all
 
@@ -148,9 +186,10 @@ class Gateway(Reader):
             assert all(elem in self.criteria for elem in self.var_def), assertion
 
         self.kwargs = kwargs
-        self.sources
+        self.sources = self._build_sources()
 
         self.store = dict()
+        self._varnames_cache = dict()
 
     def __getitem__(self, key):
         """Redefinition of dict-like behavior.
@@ -174,131 +213,123 @@ class Gateway(Reader):
         self.__setitem__(key, returned_data)
         return returned_data
 
-    @property
-    def sources(self):
+    def _build_sources(self):
         """Set up data sources (readers).
 
+        This is called once in `__init__` and the result is stored in
+        `self.sources`. Reader setup may involve requests to the servers,
+        so the readers are initialized in parallel threads unless the user
+        input `parallel=False` or there is only one reader to set up.
+
         Notes
         -----
         All readers are included by default (readers as listed in odg._SOURCES). See
          __init__ for options.
         """
 
-        if not hasattr(self, "_sources"):
-
-            # allow user to override what readers to use
-            if "readers" in self.kwargs_all.keys():
-                SOURCES = self.kwargs_all["readers"]
-                if not isinstance(SOURCES, list):
-                    SOURCES = [SOURCES]
-            else:
-                SOURCES = odg._SOURCES
-
-            # loop over data sources to set them up
-            sources = []
-            for source in SOURCES:
-                #                 print(source.reader)
-
-                # in case of important options for readers
-                # but the built in options are ignored for a reader
-                # if one is input in kwargs[source.reader]
-                if source.reader in odg.OPTIONS.keys():
-                    reader_options = odg.OPTIONS[source.reader]
-                    reader_key = list(reader_options.keys())[0]
-                    # if the user input their own option for this, use it instead
-                    # this makes it loop once
-                    if (source.reader in self.kwargs.keys()) and (
-                        reader_key in self.kwargs[source.reader]
-                    ):
-                        #                         reader_values = [None]
-                        reader_values = self.kwargs[source.reader][reader_key]
-                    else:
-                        reader_values = list(reader_options.values())[0]
-                else:
-                    reader_key = None
-                    # this is to make it loop once for cases without
-                    # extra options like localReader
-                    reader_values = [None]
-                if not isinstance(reader_values, list):
-                    reader_values = [reader_values]
-
-                # catch if the user is putting in a set of variables to match
-                # the set of reader options
-                if (source.reader in self.kwargs) and (
-                    "variables" in self.kwargs[source.reader]
-                ):
-                    variables_values = self.kwargs[source.reader]["variables"]
-                    if not isinstance(variables_values, list):
-                        variables_values = [variables_values]
-                #                     if len(reader_values) == variables_values:
-                #                         variables_values
-                # catch scenario where variables input to all readers at once
-                elif "variables" in self.kwargs_all:
-                    variables_values = [self.kwargs_all["variables"]] * len(
-                        reader_values
-                    )
-                else:
-                    variables_values = [None] * len(reader_values)
-
-                # catch if the user is putting in a set of dataset_ids to match
-                # the set of reader options
-                if (source.reader in self.kwargs) and (
-                    "dataset_ids" in self.kwargs[source.reader]
+        # allow user to override what readers to use
+        if "readers" in self.kwargs_all.keys():
+            SOURCES = self.kwargs_all["readers"]
+            if not isinstance(SOURCES, list):
+                SOURCES = [SOURCES]
+        else:
+            SOURCES = odg._SOURCES
+
+        # loop over data sources to collect their setup arguments
+        setups = []
+        for source in SOURCES:
+            #                 print(source.reader)
+
+            # in case of important options for readers
+            # but the built in options are ignored for a reader
+            # if one is input in kwargs[source.reader]
+            if source.reader in odg.OPTIONS.keys():
+                reader_options = odg.OPTIONS[source.reader]
+                reader_key = list(reader_options.keys())[0]
+                # if the user input their own option for this, use it instead
+                # this makes it loop once
+                if (source.reader in self.kwargs.keys()) and (
+                    reader_key in self.kwargs[source.reader]
                 ):
-                    dataset_ids_values = self.kwargs[source.reader]["dataset_ids"]
-                    if not isinstance(dataset_ids_values, list):
-                        dataset_ids_values = [dataset_ids_values]
-                #                     if len(reader_values) == variables_values:
-                #                         variables_values
+                    #                         reader_values = [None]
+                    reader_values = self.kwargs[source.reader][reader_key]
                 else:
-                    dataset_ids_values = [None] * len(reader_values)
-
-                for option, variables, dataset_ids in zip(
-                    reader_values, variables_values, dataset_ids_values
-                ):
-                    # setup reader with kwargs for that reader
-                    # prioritize input kwargs over default args
-                    # NEED TO INCLUDE kwargs that go to all the readers
-                    args = {}
-                    args_in = {
-                        **args,
-                        **self.kwargs_all,
-                        #                                reader_key: option,
-                        #                                **self.kwargs[source.reader],
-                    }
-
-                    if source.reader in self.kwargs.keys():
-                        args_in = {
-                            **args_in,
-                            **self.kwargs[source.reader],
-                        }
-
-                    args_in = {**args_in, reader_key: option}
-
-                    # deal with variables separately
-                    args_in = {
-                        **args_in,
-                        "variables": variables,
-                    }
-
-                    # # deal with dataset_ids separately
-                    # args_in = {
-                    #     **args_in,
-                    #     "dataset_ids": dataset_ids,
-                    # }
-
-                    if self.kwargs_all["approach"] == "region":
-                        reader = source.region(args_in)
-                    elif self.kwargs_all["approach"] == "stations":
-                        reader = source.stations(args_in)
-
-                    sources.append(reader)
-
-            self._sources = sources
+                    reader_values = list(reader_options.values())[0]
+            else:
+                reader_key = None
+                # this is to make it loop once for cases without
+                # extra options like localReader
+                reader_values = [None]
+            if not isinstance(reader_values, list):
+                reader_values = [reader_values]
+
+            # catch if the user is putting in a set of variables to match
+            # the set of reader options
+            if (source.reader in self.kwargs) and (
+                "variables" in self.kwargs[source.reader]
+            ):
+                variables_values = self.kwargs[source.reader]["variables"]
+                if not isinstance(variables_values, list):
+                    variables_values = [variables_values]
+            #                     if len(reader_values) == variables_values:
+            #                         variables_values
+            # catch scenario where variables input to all readers at once
+            elif "variables" in self.kwargs_all:
+                variables_values = [self.kwargs_all["variables"]] * len(
+                    reader_values
+                )
+            else:
+                variables_values = [None] * len(reader_values)
+
+            # catch if the user is putting in a set of dataset_ids to match
+            # the set of reader options
+            if (source.reader in self.kwargs) and (
+                "dataset_ids" in self.kwargs[source.reader]
+            ):
+                dataset_ids_values = self.kwargs[source.reader]["dataset_ids"]
+                if not isinstance(dataset_ids_values, list):
+                    dataset_ids_values = [dataset_ids_values]
+            #                     if len(reader_values) == variables_values:
+            #                         variables_values
+            else:
+                dataset_ids_values = [None] * len(reader_values)
+
+            # the invariant part of the reader arguments; built once per
+            # source then copied and customized per reader option below.
+            # prioritize input kwargs over default args
+            # NEED TO INCLUDE kwargs that go to all the readers
+            base_args = {**self.kwargs_all, **self.kwargs.get(source.reader, {})}
+
+            for option, variables, dataset_ids in zip(
+                reader_values, variables_values, dataset_ids_values
+            ):
+                # setup reader with kwargs for that reader
+                args_in = base_args.copy()
+                args_in[reader_key] = option
+
+                # deal with variables separately
+                args_in["variables"] = variables
+
+                # # deal with dataset_ids separately
+                # args_in["dataset_ids"] = dataset_ids
+
+                if self.kwargs_all["approach"] == "region":
+                    setups.append((source.region, args_in))
+                elif self.kwargs_all["approach"] == "stations":
+                    setups.append((source.stations, args_in))
+
+        # initialize the readers, in parallel if there is more than one
+        if self.kwargs_all.get("parallel", True) and len(setups) > 1:
+            with ThreadPoolExecutor(max_workers=len(setups)) as executor:
+                sources = list(
+                    executor.map(lambda setup: setup[0](setup[1]), setups)
+                )
+        else:
+            sources = [initialize(args_in) for initialize, args_in in setups]
 
-        return self._sources
+        return sources
 
-    @property
+    @cached_property
     def dataset_ids(self):
         """Find dataset_ids for each source/reader.
 
@@ -314,7 +345,7 @@ class Gateway(Reader):
 
         return dataset_ids
 
-    @property
+    @cached_property
     def meta(self):
         """Find and return metadata for datasets.
 
@@ -333,18 +364,16 @@ class Gateway(Reader):
         are always available.
         """
 
-        if not hasattr(self, "_meta"):
-
-            # loop over data sources to read in metadata
-            meta = []
-            for source in self.sources:
-                meta.append(source.meta)
-
-            # self._meta = meta
-            # merge metadata into one DataFrame
-            self._meta = pd.concat(meta, axis=0, join="outer")
+        # read in metadata for the data sources, in parallel threads since
+        # each may involve network requests
+        if self.kwargs_all.get("parallel", True) and len(self.sources) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+                meta = list(executor.map(lambda source: source.meta, self.sources))
+        else:
+            meta = [source.meta for source in self.sources]
 
-        return self._meta
+        # merge metadata into one DataFrame
+        return pd.concat(meta, axis=0, join="outer")
 
     def data_by_dataset(self, dataset_id):
         """Return the data for a single dataset_id.
@@ -366,8 +395,8 @@ class Gateway(Reader):
                 found_data = source[dataset_id]
                 return found_data
 
-    @property
-    def data(self, dataset_ids=dataset_ids):
+    @cached_property
+    def data(self):
         """Return the data, given metadata.
 
         THIS IS NOW OUTDATED.
@@ -378,59 +407,87 @@ class Gateway(Reader):
         in serial.
         """
 
-        if not hasattr(self, "_data"):
+        # collect the readers' data methods; nothing is fetched here since
+        # source.data is not called, so there is nothing to parallelize
+        data = [source.data for source in self.sources]
 
-            # loop over data sources to read in data
-            data = []
-            for source in self.sources:
+        # # make dict from individual dicts
+        # from collections import ChainMap
+        #
+        # data = ChainMap(*[d() for d in data])
+        return data
 
-                # import pdb; pdb.set_trace()
-                data.append(source.data)
-                # data.append(source[dataset_ids])
-                # data.append(source.data(dataset_ids=dataset_ids))
+    def _match_var_def(self, dd):
+        """Match the custom variable names in var_def to variables in dd.
 
-            # import pdb; pdb.set_trace()
-            # # make dict from individual dicts
-            # from collections import ChainMap
-            #
-            # data = ChainMap(*[d() for d in data])
-            self._data = data
+        dd_varnames are the variable names in the Dataset dd and
+        cf_varnames are the custom names we can use to refer to the
+        variables through cf-xarray.
 
-        return self._data
+        Results are cached on the variable (or column) names of dd since
+        many dataset_ids from one reader share the same variable set and
+        the regex matching cost can be amortized across them.
 
-    def qc(self, dataset_ids=None, verbose=False, skip_units=False):
-        """Light quality check on data.
+        Returns
+        -------
+        Tuple of (dd_varnames, cf_varnames), lists of equal length.
+        """
 
-        This runs one IOOS QARTOD on data as a first order quality check.
-        Only returns data that is quality checked.
+        assertion = "data should be a DataFrame or a Dataset"
+        assert isinstance(dd, (pd.DataFrame, xr.Dataset)), assertion
 
-        Requires pint for unit handling. Requires user-input `criteria` and
-        `var_def` to run.
+        if isinstance(dd, pd.DataFrame):
+            # use the level-0 names so MultiIndex (name, units) columns are
+            # not materialized as tuples; matching is by name only
+            signature = ("DataFrame",) + tuple(dd.columns.get_level_values(0).unique())
+        elif isinstance(dd, xr.Dataset):
+            signature = ("Dataset",) + tuple(sorted(dd.data_vars))
 
-        This is slow if your data is both chunks of time and space, so this
-        should first narrow by both as much as possible.
+        if signature not in self._varnames_cache:
+            if isinstance(dd, pd.DataFrame):
+                dd_varnames, cf_varnames = [], []
+                for var in self.var_def.keys():
+                    try:
+                        varname = dd.cf[var].name
+                        dd_varnames.append(varname)
+                        cf_varnames.append(var)
+                    except:
+                        pass
+            elif isinstance(dd, xr.Dataset):
+                # build both name lists in a single pass, calling
+                # _get_custom_criteria only once per custom variable name
+                # since each call scans the attributes of every variable
+                # in the Dataset
+                dd_varnames, cf_varnames = [], []
+                for var in self.var_def.keys():
+                    match = cf_xarray.accessor._get_custom_criteria(dd, var)
+                    if len(match) > 0:
+                        dd_varnames.extend(match)
+                        cf_varnames.append(var)
+            self._varnames_cache[signature] = (dd_varnames, cf_varnames)
+
+        return self._varnames_cache[signature]
+
+    def qc_iter(self, dataset_ids=None, skip_units=False):
+        """Generator that runs the quality check dataset by dataset.
+
+        This backs `qc` and yields each dataset as soon as it has been
+        checked, so downstream code (plotting, writing to disk) can start
+        on early datasets while later, possibly slower, ones are still
+        being processed. See `qc` for full documentation.
 
         Parameters
         ----------
         dataset_ids: str, list, optional
             Read in data for dataset_ids specifically. If none are
             provided, data will be read in for all `self.keys()`.
-        verbose: boolean, optional
-            If True, report summary statistics on QC flag distribution in datasets.
         skip_units: boolean, optional
             If True, do not interpret or alter units and assume the data is in
             the units described in var_def already.
 
-        Returns
-        -------
-        Dataset with added variables for each variable in dataset that was checked, with name of [variable]+'_qc'.
-
-        Notes
-        -----
-        Code has been saved for data in DataFrames, but is changing so
-        that data will be in Datasets. This way, can use cf-xarray
-        functionality for custom variable names and easier to have
-        recognizable units for variables with netcdf than csv.
+        Yields
+        ------
+        Tuples of (dataset_id, data) where data has added variables for each variable in the dataset that was checked, with name of [variable]+'_qc'.
         """
 
         assertion = (
@@ -447,111 +504,195 @@ class Gateway(Reader):
             if not isinstance(data_ids, list):
                 data_ids = [data_ids]
 
-        data_out = {}
+        # the gross range spans depend only on var_def, so build them once
+        # instead of per (dataset_id, variable)
+        spans = {
+            var: {
+                "fail_span": self.var_def[var]["fail_span"],
+                "suspect_span": self.var_def[var]["suspect_span"],
+            }
+            for var in self.var_def.keys()
+        }
+
         for data_id in data_ids:
             # access the Dataset
             dd = self[data_id]
             # which custom variable names are in dataset
-            # dd_varnames are the variable names in the Dataset dd
-            # cf_varnames are the custom names we can use to refer to the
-            # variables through cf-xarray
-            if isinstance(dd, pd.DataFrame):
-                varnames, cf_varnames = [], []
-                for var in self.var_def.keys():
-                    try:
-                        varname = dd.cf[var].name
-                        varnames.append(varname)
-                        cf_varnames.append(var)
-                    except:
-                        pass
-            elif isinstance(dd, xr.Dataset):
-                varnames = [
-                    (cf_xarray.accessor._get_custom_criteria(dd, var), var)
-                    for var in self.var_def.keys()
-                    if len(cf_xarray.accessor._get_custom_criteria(dd, var)) > 0
-                ]
-            assert len(varnames) > 0, "no custom names matched in Dataset."
-            if isinstance(dd, pd.DataFrame):
-                dd_varnames = varnames.copy()
-            elif isinstance(dd, xr.Dataset):
-                dd_varnames, cf_varnames = zip(*varnames)
-                dd_varnames = sum(dd_varnames, [])
+            dd_varnames, cf_varnames = self._match_var_def(dd)
+            assert len(dd_varnames) > 0, "no custom names matched in Dataset."
             assert len(dd_varnames) == len(
                 cf_varnames
             ), "looks like multiple variables might have been identified for a custom variable name"
 
             # subset to just the boem or requested variables for each df or ds
             if isinstance(dd, pd.DataFrame):
-                dd2 = dd[list(varnames)]
+                dd2 = dd[dd_varnames]
             elif isinstance(dd, xr.Dataset):
                 dd2 = dd.cf[cf_varnames]
                 # dd2 = dd[varnames]  # equivalent
 
+                # if a dataset was opened with very many small chunks, the
+                # dask graph itself becomes the bottleneck. Consolidate
+                # small dimensions into single chunks before running QC.
+                nchunks = sum(
+                    int(np.prod([len(sizes) for sizes in dd2[Var].chunks]))
+                    for Var in dd2.data_vars
+                    if dd2[Var].chunks
+                )
+                if nchunks > 10000:
+                    small_dims = {
+                        dim: -1 for dim, size in dd2.dims.items() if size <= 100
+                    }
+                    if small_dims:
+                        dd2 = dd2.chunk(small_dims)
+
+                # pin the selection in memory so the pint and QARTOD passes
+                # below do not each re-read the chunks: read it in if small
+                # enough, otherwise persist the dask-backed intermediate
+                if dd2.chunks:
+                    if dd2.nbytes < 2 * 1024 ** 3:  # 2 GiB
+                        dd2 = dd2.load()
+                    else:
+                        dd2 = dd2.persist()
+
             if not skip_units:
 
                 # Preprocess to change salinity units away from 1e-3
                 if isinstance(dd, pd.DataFrame):
                     # this replaces units in the 2nd column level of 1e-3 with psu
-                    new_levs = [
-                        "psu" if col == "1e-3" else col for col in dd2.columns.levels[1]
-                    ]
-                    dd2.columns.set_levels(new_levs, level=1, inplace=True)
+                    levs = dd2.columns.levels[1]
+                    new_levs = levs.where(levs != "1e-3", "psu")
+                    dd2.columns = dd2.columns.set_levels(new_levs, level=1)
                 elif isinstance(dd, xr.Dataset):
-                    for Var in dd2.data_vars:
-                        if (
-                            "units" in dd2[Var].attrs
-                            and dd2[Var].attrs["units"] == "1e-3"
-                        ):
-                            dd2[Var].attrs["units"] = "psu"
-                # run pint quantify on each data structure
-                dd2 = dd2.pint.quantify()
-                # dd2 = dd2.pint.quantify(level=-1)
-
-                # go through each variable by name to make sure in correct units
-                # have to do this in separate loop so that can dequantify afterward
+                    for Var in [
+                        Var
+                        for Var in dd2.data_vars
+                        if dd2[Var].attrs.get("units") == "1e-3"
+                    ]:
+                        dd2[Var].attrs["units"] = "psu"
+                # determine which variables need conversion by comparing the
+                # unit strings straight from attrs, before quantifying, so
+                # pint Quantities are not built just to read current units.
+                # Equivalent unit spellings fall through to pint.to, which
+                # handles them without changing values.
                 if isinstance(dd, pd.DataFrame):
                     print("NOT IMPLEMENTED FOR DATAFRAME YET")
+                    units_dict = {}
                 elif isinstance(dd, xr.Dataset):
                     # form of "temp": "degree_Celsius"
+                    # only include variables that are not already in the
+                    # conventional units so no-op conversions are skipped
                     units_dict = {
                         dd_varname: self.var_def[cf_varname]["units"]
                         for (dd_varname, cf_varname) in zip(dd_varnames, cf_varnames)
+                        if dd2[dd_varname].attrs.get("units")
+                        != self.var_def[cf_varname]["units"]
                     }
-                    # convert to conventional units
+
+                # when every variable is already in the conventional units
+                # there is nothing to convert, so skip the pint
+                # quantify/dequantify round-trip entirely
+                if units_dict:
+                    # run pint quantify on each data structure
+                    dd2 = dd2.pint.quantify()
+                    # dd2 = dd2.pint.quantify(level=-1)
+
+                    # convert to conventional units in a single pass
                     dd2 = dd2.pint.to(units_dict)
 
-                dd2 = dd2.pint.dequantify()
+                    dd2 = dd2.pint.dequantify()
 
-            # now loop for QARTOD on each variable
+            # now loop for QARTOD on each variable. For DataFrames the flag
+            # columns are collected and added in one concat at the end
+            # instead of inserted one at a time, which would trigger a
+            # block consolidation per insert.
+            flag_cols = {}
             for dd_varname, cf_varname in zip(dd_varnames, cf_varnames):
-                # run QARTOD
-                qc_config = {
-                    "qartod": {
-                        "gross_range_test": {
-                            "fail_span": self.var_def[cf_varname]["fail_span"],
-                            "suspect_span": self.var_def[cf_varname]["suspect_span"],
-                        },
-                    }
-                }
-                qc = QcConfig(qc_config)
-                qc_results = qc.run(inp=dd2[dd_varname])
-                # qc_results = qc.run(inp=dd2.cf[cf_varname])  # this isn't working for some reason
-
-                # put flags into dataset
+                # run the QARTOD gross range test, vectorized, and put
+                # flags into dataset
                 new_qc_var = f"{dd_varname}_qc"
                 if isinstance(dd, pd.DataFrame):
-                    dd2[new_qc_var] = qc_results["qartod"]["gross_range_test"]
+                    # dd_varname can be the level-0 name of MultiIndex
+                    # (name, units) columns, in which case selection gives
+                    # back a one-column DataFrame; ravel so the flags are
+                    # always 1D
+                    flag_cols[new_qc_var] = _gross_range(
+                        dd2[dd_varname].to_numpy().ravel(), **spans[cf_varname]
+                    )
                 elif isinstance(dd, xr.Dataset):
-                    new_data = qc_results["qartod"]["gross_range_test"]
-                    dims = dd2[dd_varname].dims
-                    dd2[f"{dd_varname}_qc"] = (dims, new_data)
+                    # apply_ufunc keeps dask-backed variables lazy and lets
+                    # dask run the test per chunk in parallel
+                    dd2[new_qc_var] = xr.apply_ufunc(
+                        _gross_range,
+                        dd2[dd_varname],
+                        kwargs=spans[cf_varname],
+                        dask="parallelized",
+                        output_dtypes=[np.uint8],
+                        keep_attrs=False,
+                    )
+
+            if flag_cols:
+                flags_df = pd.DataFrame(flag_cols, index=dd2.index)
+                if isinstance(dd2.columns, pd.MultiIndex):
+                    # pad the flag names with empty extra levels (no units)
+                    # so the (name, units) column structure survives the
+                    # concat
+                    flags_df.columns = pd.MultiIndex.from_tuples(
+                        [
+                            (name,) + ("",) * (dd2.columns.nlevels - 1)
+                            for name in flags_df.columns
+                        ]
+                    )
+                dd2 = pd.concat([dd2, flags_df], axis=1, copy=False)
+
+            yield data_id, dd2
 
-            data_out[data_id] = dd2
+    def qc(self, dataset_ids=None, verbose=False, skip_units=False):
+        """Light quality check on data.
+
+        This runs one IOOS QARTOD on data as a first order quality check.
+        Only returns data that is quality checked.
+
+        Requires pint for unit handling. Requires user-input `criteria` and
+        `var_def` to run.
+
+        This is slow if your data is both chunks of time and space, so this
+        should first narrow by both as much as possible.
+
+        Use `qc_iter` directly instead to consume each dataset as soon as
+        it has been checked rather than waiting for all of them.
+
+        Parameters
+        ----------
+        dataset_ids: str, list, optional
+            Read in data for dataset_ids specifically. If none are
+            provided, data will be read in for all `self.keys()`.
+        verbose: boolean, optional
+            If True, report summary statistics on QC flag distribution in datasets.
+        skip_units: boolean, optional
+            If True, do not interpret or alter units and assume the data is in
+            the units described in var_def already.
+
+        Returns
+        -------
+        Dataset with added variables for each variable in dataset that was checked, with name of [variable]+'_qc'.
+
+        Notes
+        -----
+        Code has been saved for data in DataFrames, but is changing so
+        that data will be in Datasets. This way, can use cf-xarray
+        functionality for custom variable names and easier to have
+        recognizable units for variables with netcdf than csv.
+        """
+
+        data_out = dict(
+            self.qc_iter(dataset_ids=dataset_ids, skip_units=skip_units)
+        )
 
         if verbose:
             for dataset_id, dd in data_out.items():
                 print(dataset_id)
-                qckeys = dd2[[var for var in dd.data_vars if "_qc" in var]]
+                qckeys = dd[[var for var in dd.data_vars if "_qc" in var]]
                 for qckey in qckeys:
                     print(qckey)
                     for flag, desc in odg.qcdefs.items():
@@ -57,7 +57,12 @@ class AxdsReader(Reader):
     """
 
     def __init__(
-        self, parallel=True, catalog_name=None, axds_type="platform2", filetype="netcdf"
+        self,
+        parallel=True,
+        catalog_name=None,
+        axds_type="platform2",
+        filetype="netcdf",
+        chunks=None,
     ):
         """
         Parameters
@@ -71,9 +76,15 @@ class AxdsReader(Reader):
             Which Axiom database type to search for.
             * "platform2" (default): gliders, drifters; result in pandas DataFrames
             * "layer_group": grids, model output; result in xarray Datasets
+        chunks: dict, optional
+            How to chunk Datasets that are opened with xarray, for example
+            `chunks={"time": -1}`. None (default) reads each variable in as
+            a single chunk, which avoids building very large dask task
+            graphs for datasets with many small native chunks.
         """
 
         self.parallel = parallel
+        self.chunks = chunks
 
         # search Axiom database, version 2
         self.url_search_base = "https://search.axds.co/v2/search?portalId=-1&page=1&pageSize=10000&verbose=true"
@@ -714,7 +725,9 @@ sources:
                 # this downloads the http-served file to cache I think
                 download_url = self.catalog[dataset_id].urlpath
                 infile = fsspec.open(f"simplecache::{download_url}")
-                data = xr.open_dataset(infile.open())  # , engine='h5netcdf')
+                data = xr.open_dataset(
+                    infile.open(), chunks=self.chunks
+                )  # , engine='h5netcdf')
                 # we need 'time' as a dimension for the subsequent line to work
                 dim = [
                     dim for dim, size in data.dims.items() if size == data.cf["T"].size
@@ -872,6 +885,7 @@ class region(AxdsReader):
             "catalog_name": kwargs.get("catalog_name", None),
             "parallel": kwargs.get("parallel", True),
             "axds_type": kwargs.get("axds_type", "platform2"),
+            "chunks": kwargs.get("chunks", None),
         }
         AxdsReader.__init__(self, **ax_kwargs)
 
@@ -965,6 +979,7 @@ class stations(AxdsReader):
             "catalog_name": kwargs.get("catalog_name", None),
             "parallel": kwargs.get("parallel", True),
             "axds_type": kwargs.get("axds_type", "platform2"),
+            "chunks": kwargs.get("chunks", None),
         }
         # this inherits AxdsReader's attributes and functions into self
         AxdsReader.__init__(self, **ax_kwargs)
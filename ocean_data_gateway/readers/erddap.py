@@ -53,7 +53,14 @@ class ErddapReader(Reader):
         reader is defined as "ErddapReader".
     """
 
-    def __init__(self, known_server="ioos", protocol=None, server=None, parallel=False):
+    def __init__(
+        self,
+        known_server="ioos",
+        protocol=None,
+        server=None,
+        parallel=False,
+        chunks=None,
+    ):
         """
         Parameters
         ----------
@@ -71,8 +78,14 @@ class ErddapReader(Reader):
         parallel: boolean
             If True, run with simple parallelization using `multiprocessing`.
             If False, run serially.
+        chunks: dict, optional
+            How to chunk Datasets that are opened with xarray, for example
+            `chunks={"time": -1}`. None (default) reads each variable in as
+            a single chunk, which avoids building very large dask task
+            graphs for datasets with many small native chunks.
         """
         self.parallel = parallel
+        self.chunks = chunks
 
         # hard wire this for now
         filetype = "netcdf"
@@ -539,7 +552,7 @@ class ErddapReader(Reader):
                     #     time=slice(self.kw["min_time"], self.kw["max_time"])
                     # )
                     download_url = self.e.get_download_url(response="opendap")
-                    dd = xr.open_dataset(download_url, chunks="auto").sel(
+                    dd = xr.open_dataset(download_url, chunks=self.chunks).sel(
                         time=slice(self.kw["min_time"], self.kw["max_time"])
                     )
 
@@ -652,6 +665,7 @@ class region(ErddapReader):
             "protocol": kwargs.get("protocol", None),
             "server": kwargs.get("server", None),
             "parallel": kwargs.get("parallel", True),
+            "chunks": kwargs.get("chunks", None),
         }
         ErddapReader.__init__(self, **er_kwargs)
 
@@ -746,6 +760,7 @@ class stations(ErddapReader):
             "protocol": kwargs.get("protocol", None),
             "server": kwargs.get("server", None),
             "parallel": kwargs.get("parallel", True),
+            "chunks": kwargs.get("chunks", None),
         }
         ErddapReader.__init__(self, **er_kwargs)
 
@@ -47,7 +47,9 @@ class LocalReader(Reader):
     which we know the specific file location?
     """
 
-    def __init__(self, parallel=True, catalog_name=None, filenames=None, kw=None):
+    def __init__(
+        self, parallel=True, catalog_name=None, filenames=None, kw=None, chunks=None
+    ):
         """
         Parameters
         ----------
@@ -61,6 +63,12 @@ class LocalReader(Reader):
         kw: dict
             Contains space and time search constraints: `min_lon`, `max_lon`,
             `min_lat`, `max_lat`, `min_time`, `max_time`.
+        chunks: dict, optional
+            How to chunk netcdf files that are opened with xarray, for
+            example `chunks={"time": -1}`. None (default) reads each
+            variable in as a single chunk, which avoids building very
+            large dask task graphs for datasets with many small native
+            chunks.
 
         Notes
         -----
@@ -72,6 +80,7 @@ class LocalReader(Reader):
         """
 
         self.parallel = parallel
+        self.chunks = chunks
 
         if catalog_name is None:
             name = f"{pd.Timestamp.now().isoformat()}"
@@ -155,7 +164,7 @@ class LocalReader(Reader):
                     file_intake.metadata = metadata
 
                 elif "nc" in filename:
-                    file_intake = intake.open_netcdf(filename)
+                    file_intake = intake.open_netcdf(filename, chunks=self.chunks)
                     data = file_intake.read()
                     coords = list(data.coords.keys())
                     if "T" in data.cf.get_valid_keys():
@@ -336,6 +345,7 @@ class region(LocalReader):
             "catalog_name": kwargs.get("catalog_name", None),
             "filenames": kwargs.get("filenames", None),
             "parallel": kwargs.get("parallel", True),
+            "chunks": kwargs.get("chunks", None),
         }
         LocalReader.__init__(self, **lo_kwargs)
 
@@ -385,6 +395,7 @@ class stations(LocalReader):
             "catalog_name": kwargs.get("catalog_name", None),
             "filenames": kwargs.get("filenames", None),
             "parallel": kwargs.get("parallel", True),
+            "chunks": kwargs.get("chunks", None),
         }
         LocalReader.__init__(self, **loc_kwargs)
 
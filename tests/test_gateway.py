@@ -74,3 +74,13 @@ def test_qc_error():
 
     with pytest.raises(AssertionError):
         assert (data.qc()[fname]["temperature_qc"] == np.ones(10)).all()
+
+
+def test_gross_range():
+    """Vectorized gross range test gives expected QARTOD flags."""
+
+    from ocean_data_gateway.gateway import _gross_range
+
+    arr = np.array([0, 20, 50, 200, np.nan])
+    flags = _gross_range(arr, fail_span=[-100, 100], suspect_span=[-10, 40])
+    assert (flags == np.array([1, 1, 3, 4, 9])).all()